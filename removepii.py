@@ -2,11 +2,103 @@
 # Python 3.9
 
 import argparse
-import nltk
+import functools
+import locale
+import mmap
+import multiprocessing
 import re
 import os
 import pathlib
 
+# the spaCy pipeline, which is loaded by _getNLP the first time named entities are needed
+# so that importing this module or cleaning only ID info doesn't pay for importing spaCy
+_NLP = None
+
+# the number of recently analyzed texts whose named entities are remembered
+# only texts short enough to be analyzed in a single window are remembered, so long documents never fill the cache
+# set the REMOVEPII_NE_CACHE environment variable to 0 to turn this off, e.g. when streaming many unique texts
+_NE_CACHE_SIZE = int(os.environ.get("REMOVEPII_NE_CACHE", "256"))
+
+# maps spaCy's entity labels to the named entity PII types accepted by getNE
+_NE_LABELS = {
+    "PERSON": "PERSON",
+    "ORG": "ORGANIZATION",
+    "GPE": "GPE",
+    "LOC": "LOCATION",
+}
+
+# text files larger than this many bytes are memory-mapped by extract rather than read
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+# long texts are searched for named entities in windows this many characters apart, so the text being analyzed stays
+# in the CPU cache and spaCy is never given more text than it accepts at once
+_WINDOW_SIZE = 256 * 1024
+
+# how many characters each window runs into the next one, which should be longer than any single piece of PII
+_WINDOW_OVERLAP = 128
+
+# ID info regex bodies keyed by PII type. They are combined into a single alternation
+# so the text is scanned once no matter how many types are requested.
+# Email comes first so an address containing digits is matched whole rather than as a phone number.
+# The patterns don't use any capturing groups, since only the whole match is used.
+_ID_PATTERNS = {
+    # email address regex
+    "EMAIL": r'''
+        (?<![a-zA-Z0-9._%+-]) # must start at the beginning of a run of username characters
+                              # (\b would also hold after every "." in a long run, rescanning the run from each one)
+        [a-zA-Z0-9._%+-]+ # username
+        @ # @symbol
+        [a-zA-Z0-9.-]+ # domain
+        \.[a-zA-Z]{2,} # .something
+        \b # must end at a word boundary
+        ''',
+
+    # social security number regex
+    "SSN": r'''
+        \b # must start at a word boundary
+        (?!666|000|9\d{2})\d{3} # SSN can't begin with 666, 000 or anything between 900-999
+        - # explicit dash (separating Area and Group numbers)
+        (?!00)\d{2} # don't allow the Group Number to be "00"
+        - # another dash (separating Group and Serial numbers)
+        (?!0{4})\d{4} # don't allow last four digits to be "0000"
+        \b # must end at a word boundary
+        ''',
+
+    # phone number regex
+    "PHONE": r'''
+        (?<!\w) # must not follow a word character (\b would fail before an opening parenthesis)
+        (?:\(\d{3}\)[\s.-]?|\d{3}[\s.-])? # optional area code, with its separator folded in so there is only one way to match it
+        \d{3} # first 3 digits
+        [\s.-] # separator
+        \d{4} # last 4 digits
+        (?:\s*(?:ext\.?|x)\s*\d{2,5})? # optional extension
+        \b # must end at a word boundary
+        ''',
+}
+
+# any digit, which every phone number contains
+_DIGIT_RE = re.compile(r"\d")
+
+# checks for something each type of ID info can't be found without, which is much cheaper than searching for the full pattern.
+# types whose prefilter fails are left out of the combined regex, and the scan is skipped if none are left.
+_ID_PREFILTERS = {
+    "EMAIL": lambda text: "@" in text,
+    "SSN": lambda text: "-" in text,
+    "PHONE": lambda text: _DIGIT_RE.search(text) is not None,
+}
+
+@functools.lru_cache(maxsize=None)
+def _compileIDRegex(types):
+    """Compiles one regex matching every requested type of ID info.
+
+    Args:
+        types (frozenset): The types of ID info to match. Options: EMAIL, PHONE, SSN
+
+    Returns:
+        re.Pattern: The combined regex.
+    """
+    return re.compile("|".join(f"(?:{p})" for t, p in _ID_PATTERNS.items() if t in types), re.VERBOSE)
+
 def extract(filePath):
     """Extracts the textual information from a file.
 
@@ -24,6 +116,14 @@ def extract(filePath):
 
     # extract all data from pure text files
     if ext == ".txt" or ext == ".md":
+        # large files are memory-mapped and decoded straight from the mapping,
+        # so the raw bytes are paged in by the OS instead of being copied into memory first
+        if os.path.getsize(filePath) > _MMAP_THRESHOLD:
+            with open(filePath, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, locale.getpreferredencoding(False))
+            # translates newlines the same way reading a smaller file in text mode does
+            return text.replace("\r\n", "\n").replace("\r", "\n")
+
         text = None
         with open(filePath) as file:
             text = file.read()
@@ -43,6 +143,78 @@ def extract(filePath):
 
     raise ValueError(f"Text from file {filePath} could not be extracted. Supported types are TXT, PDF, HTML.")
 
+def _getNLP():
+    """Gets the spaCy pipeline, loading it if this is the first time it's needed.
+
+    Returns:
+        spacy.language.Language: The pipeline used to find named entities.
+    """
+    global _NLP
+    if _NLP is None:
+        import spacy
+        # only the named entity recognizer is needed, so the parser and lemmatizer are left out
+        _NLP = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer", "attribute_ruler"])
+    return _NLP
+
+def _docNE(doc, piiNE):
+    """Gets the named entities classified as PII in a document already processed by spaCy.
+
+    Args:
+        doc (spacy.tokens.Doc): The processed text to analyze.
+        piiNE (list): The types of named entities classified as PII that should be removed. Options: PERSON, ORGANIZATION, GPE, LOCATION.
+
+    Returns:
+        set: The (string, start, end) tuples of the named entity PII, where start and end are the PII's character offsets in the text.
+    """
+    # the set removes duplicates as they're added
+    pii = set()
+
+    # loops through all entities with a PII label
+    for ent in doc.ents:
+        if _NE_LABELS.get(ent.label_) in piiNE:
+            # adds the PII's full text string and where it is in the text to the set
+            # ex: ("Google Science Fair", 24, 43)
+            pii.add((ent.text, ent.start_char, ent.end_char))
+    
+    return pii
+
+@functools.lru_cache(maxsize=_NE_CACHE_SIZE)
+def _cachedNE(text, piiNE):
+    """Gets the named entities classified as PII in the text, reusing the result if the same text was analyzed recently.
+
+    Args:
+        text (str): The text to analyze.
+        piiNE (frozenset): The types of named entities classified as PII that should be removed.
+
+    Returns:
+        frozenset: The (string, start, end) tuples of the named entity PII.
+    """
+    return frozenset(_docNE(_getNLP()(text), piiNE))
+
+def _findNE(text, piiNE):
+    """Gets the named entities classified as PII in the text, a window at a time if the text is long.
+
+    Args:
+        text (str): The text to analyze.
+        piiNE (frozenset): The types of named entities classified as PII that should be removed.
+
+    Returns:
+        set: The (string, start, end) tuples of the named entity PII, where start and end are the PII's character offsets in the text.
+    """
+    # texts that fit in one window are looked up in the cache
+    # the cached result is copied so callers can't modify it
+    if len(text) <= _WINDOW_SIZE + _WINDOW_OVERLAP:
+        return set(_cachedNE(text, piiNE))
+
+    # longer texts are analyzed a window at a time so spaCy's working set stays small, without caching the windows,
+    # which would keep them in memory and are unlikely to be seen again
+    nlp = _getNLP()
+    pii = set()
+    for offset, window in _windows(text):
+        # PII found twice where windows overlap is only kept once
+        pii.update(_shiftSpans(_docNE(nlp(window), piiNE), offset))
+    return pii
+
 def getNE(text, piiNE):
     """Gets the named entities classified as PII in the text.
 
@@ -51,29 +223,14 @@ def getNE(text, piiNE):
         piiNE (list): The types of named entities classified as PII that should be removed. Options: PERSON, ORGANIZATION, GPE, LOCATIOn.
 
     Returns:
-        set: The set of strings holding named entity PII.
+        set: The (string, start, end) tuples of the named entity PII, where start and end are the PII's character offsets in the text.
     """
-    # search for NLTK required data in this directory so the user doesn't need to download it separately
-    nltk.data.path.append(os.getcwd())
+    # skips loading spaCy entirely if no named entities are being removed
+    if not piiNE:
+        return set()
+
     # gets all of the named entities in the text
-    ne = nltk.ne_chunk(nltk.pos_tag(nltk.word_tokenize(text)))
-    pii = []
-
-    # checks if a subtree contains PII (i.e. it should be removed)
-    def filterPII(x):
-        return x.label() in piiNE
-
-    # loops through all subtrees with a PII label
-    for sub in ne.subtrees(filter = filterPII):
-        # gets the PII's full text string from the subtree's leaves
-        # ex: [('Google', 'NNP'), ('Science', 'NNP'), ('Fair', 'NNP')] -> Google Science Fair
-        piiStr = " ".join(pair[0] for pair in sub.leaves())
-        # adds the PII string to the list
-        if piiStr not in pii:
-            pii.append(piiStr)
-    
-    # converts to a set before returning to remove duplicates
-    return set(pii)
+    return _findNE(text, frozenset(piiNE))
 
 def getIDInfo(text, types):
     """Gets the ID info classified as PII in the text.
@@ -83,71 +240,169 @@ def getIDInfo(text, types):
         types (list): The types of ID info classified as PII that should be removed. Options: EMAIL, PHONE, SSN
 
     Returns:
-        set: The set of strings holding ID info PII.
+        set: The (string, start, end) tuples of the ID info PII, where start and end are the PII's character offsets in the text.
     """
-    # gets whether each ID info type should be removed.
-    phone = "PHONE" in types
-    email = "EMAIL" in types
-    ssn = "SSN" in types
+    # only keep the ID info types we know how to find
+    return _scanIDInfo(text, frozenset(types).intersection(_ID_PATTERNS))
 
-    # return an empty set if we're not looking for any ID info PII
-    if not(phone or email or ssn):
-        return set([])
-
-    # initialize the phone number regex
-    if phone: phoneRegex = re.compile(r'''(
-        (\d{3}|\(\d{3}\))? # area code
-        (\s|-|\.)? # separator
-        (\d{3}) # first 3 digits
-        (\s|-|\.) # separator
-        (\d{4}) # last 4 digits
-        (\s*(ext|x|ext.)\s*(\d{2,5}))? # optional extension
-        )''', re.VERBOSE)
-
-    # initialize the email address regex
-    if email: emailRegex = re.compile(r'''(
-        [a-zA-Z0-9._%+-] + # username
-        @ # @symbol
-        [a-zA-Z0-9.-] + # domain
-        (\.[a-zA-Z]{2,4}) # .something
-        )''', re.VERBOSE)
-
-    # initialize the social security number regex
-    if ssn: ssnRegex = re.compile(r'''(
-        (?!666|000|9\d{2})\d{3} # SSN can't begin with 666, 000 or anything between 900-999
-        - # explicit dash (separating Area and Group numbers)
-        (?!00)\d{2} # don't allow the Group Number to be "00"
-        - # another dash (separating Group and Serial numbers)
-        (?!0{4})\d{4} # don't allow last four digits to be "0000"
-        )''', re.VERBOSE)
+def _scanIDInfo(text, types):
+    """Gets the ID info classified as PII in the text.
 
-    pii = []
+    Args:
+        text (str): The text to analyze.
+        types (frozenset): The types of ID info classified as PII that should be removed. Every type must be a key of _ID_PATTERNS.
 
-    # utility method for getting PII matches
-    def getMatches(pattern, t):
-        # for each match, return the match itself if it is a string or the first member of a tuple match
-        # this is because matches are sometimes tuples of multiple groups, like a phone number match being:
-        # ("800-999-2222", "800", "-", "999", "-", "2222")
-        # However, sometimes the matches are just strings (no groups), so accessing the element at [0] would get the first char, which is not desirable.
-        return [(match if type(match) is str else match[0]) for match in pattern.findall(t)]
+    Returns:
+        set: The (string, start, end) tuples of the ID info PII, where start and end are the PII's character offsets in the text.
+    """
+    # only keep the ID info types that could be in the text
+    types = frozenset(t for t in types if _ID_PREFILTERS[t](text))
 
-    # adds the found phone #s, emails, and SSNs to the PII list
-    if phone: pii += getMatches(phoneRegex, text)
-    if email: pii += getMatches(emailRegex, text)
-    if ssn: pii += getMatches(ssnRegex, text)
+    # return an empty set if we're not looking for any ID info PII
+    if not types:
+        return set()
 
-    # converts to a set before returning to remove duplicates
-    return set(pii)
+    # scans the text once for the found phone #s, emails, and SSNs
+    return {(match.group(), match.start(), match.end()) for match in _compileIDRegex(types).finditer(text)}
 
 def writeFile(text, path):
-    """Writes text to the file path.
+    """Writes text to the file path as UTF-8.
 
     Args:
         text (str): The text to write.
         path (str): The path to write the file to.
     """
-    with open(path, "w") as file:
-        file.write(text)
+    # encodes the whole text at once and writes the bytes directly rather than going through a text-mode wrapper
+    with open(path, "wb") as file:
+        file.write(text.encode("utf-8"))
+
+def _windows(text, size = None, overlap = None):
+    """Splits the text into overlapping windows that can be searched for PII separately.
+    Each window runs past the start of the next one, so PII cut off at the end of one window is found whole in the next.
+
+    Args:
+        text (str): The text to split.
+        size (int, optional): The distance between the starts of consecutive windows. Defaults to _WINDOW_SIZE.
+        overlap (int, optional): How far each window runs into the next one. Defaults to _WINDOW_OVERLAP.
+
+    Yields:
+        tuple: The offset of the window in the text and the window's text. A text that fits in one window is yielded whole.
+    """
+    # the defaults are read when called rather than when defined so changes to the module's settings take effect
+    if size is None: size = _WINDOW_SIZE
+    if overlap is None: overlap = _WINDOW_OVERLAP
+
+    for offset in range(0, max(len(text) - overlap, 1), size):
+        yield offset, text[offset:offset + size + overlap]
+
+def _shiftSpans(pii, offset):
+    """Moves PII found in a window of a text to where it is in the whole text.
+
+    Args:
+        pii (set): The (string, start, end) tuples of the PII found in the window.
+        offset (int): The offset of the window in the text.
+
+    Returns:
+        set: The (string, start, end) tuples with the offset added to the start and end.
+    """
+    return {(piiStr, start + offset, end + offset) for piiStr, start, end in pii}
+
+def _redact(text, spans):
+    """Replaces the spans of the text holding PII with XXXXX values.
+    PII replacement uses detector-provided spans; substring search is never used on the raw text,
+    so a name like "Al" is removed where it was found without touching words like "Alabama".
+
+    Args:
+        text (str): The text to clean.
+        spans (iterable): The (start, end) character offsets of the PII in the text. They may be unordered and may overlap.
+
+    Returns:
+        str: The cleaned text string.
+    """
+    cleaned = []
+    i = 0
+
+    # copies the text between the spans and writes XXXXX in place of each span, in one pass over the text
+    for start, end in sorted(spans):
+        # a span overlapping the previous one is merged into the XXXXX value already written
+        if start < i:
+            i = max(i, end)
+            continue
+        cleaned.append(text[i:start])
+        cleaned.append("XXXXX")
+        i = end
+    cleaned.append(text[i:])
+
+    return "".join(cleaned)
+
+class PIIRedactor:
+    """Cleans strings of a fixed set of PII types.
+    Everything that doesn't depend on the text is prepared once when the redactor is made,
+    so it's faster to reuse one redactor than to call cleanString with the same types many times.
+
+    Args:
+        piiNE (list, optional): The types of named entity PII to remove. Defaults to all types: ["PERSON", "ORGANIZATION", "GPE", "LOCATION"].
+        piiNums (list, optional): The types of ID info PII to remove. Defaults to all types: ["PHONE", "EMAIL", "SSN"].
+    """
+    def __init__(self,
+            piiNE = ["PERSON", "ORGANIZATION", "GPE", "LOCATION"], 
+            piiNums = ["PHONE", "EMAIL", "SSN"]):
+        # the types are frozen so they can key getNE's cache without being converted on every call
+        self.piiNE = frozenset(piiNE)
+        # only keep the ID info types we know how to find
+        self.piiNums = frozenset(piiNums).intersection(_ID_PATTERNS)
+        # compiles the combined ID info regex now so the first call doesn't have to
+        if self.piiNums:
+            _compileIDRegex(self.piiNums)
+
+    def find(self, text):
+        """Gets the PII in the text.
+
+        Args:
+            text (str): The text to analyze.
+
+        Returns:
+            set: The (string, start, end) tuples of the PII, where start and end are the PII's character offsets in the text.
+        """
+        # scans the whole text for ID info at once, since cutting it into windows would hide
+        # the characters around a window's edges from the regex's boundary checks
+        pii = _scanIDInfo(text, self.piiNums)
+
+        # skips loading spaCy entirely if no named entities are being removed
+        if self.piiNE:
+            pii.update(_findNE(text, self.piiNE))
+        return pii
+
+    def clean(self, text, verbose = False):
+        """Cleans a string of PII.
+
+        Args:
+            text (str): The text to clean.
+            verbose (bool, optional): Whether status updates should be printed to the console. Defaults to False.
+
+        Returns:
+            str: The cleaned text string with PII replaced with XXXXX values.
+        """
+        if verbose: print("Cleaning text: getting named entities and identifiable information...")
+        pii = self.find(text)
+        if verbose: print(str(len(pii)) + " PII instances found.")
+
+        if verbose: print("Removing PII.")
+        # return the cleaned text string
+        return _redact(text, ((start, end) for piiStr, start, end in pii))
+
+@functools.lru_cache(maxsize=None)
+def _getRedactor(piiNE, piiNums):
+    """Gets the redactor cleanString uses for the PII types, making it the first time the types are used.
+
+    Args:
+        piiNE (frozenset): The types of named entity PII to remove.
+        piiNums (frozenset): The types of ID info PII to remove.
+
+    Returns:
+        PIIRedactor: The redactor for the PII types.
+    """
+    return PIIRedactor(piiNE, piiNums)
 
 def cleanString(text, 
         verbose = False, 
@@ -164,19 +419,8 @@ def cleanString(text,
     Returns:
         str: The cleaned text string with PII replaced with XXXXX values.
     """
-    if verbose: print("Cleaning text: getting named entities and identifiable information...")
-    # combines the NE and ID info PII string sets
-    piiSet = set.union(getNE(text, piiNE), getIDInfo(text, piiNums))
-    if verbose: print(str(len(piiSet)) + " PII strings found.")
-
-    if verbose: print("Removing PII.")
-    # replaces PII with XXXXX values
-    cleaned = text
-    for pii in piiSet:
-        cleaned = cleaned.replace(pii, "XXXXX")
-    
-    # return the cleaned text string
-    return cleaned
+    # reuses the redactor made for these PII types by an earlier call
+    return _getRedactor(frozenset(piiNE), frozenset(piiNums)).clean(text, verbose)
 
 def cleanFile(filePath, outputPath, 
         verbose = False,
@@ -203,18 +447,112 @@ def cleanFile(filePath, outputPath,
     # write the cleaned text to the output file
     writeFile(cleaned, outputPath)
 
-# if this file is being executed on the command line, parse arguments and process the user's file or text
+def cleanFiles(filePaths, outputPaths,
+        verbose = False,
+        piiNE = ["PERSON", "ORGANIZATION", "GPE", "LOCATION"], 
+        piiNums = ["PHONE", "EMAIL", "SSN"],
+        processes = 1):
+    """Reads several files with PII and saves a copy of each file with PII removed.
+    Named entities are found for all of the files in batches, which is faster than calling cleanFile on each one.
+
+    Args:
+        filePaths (list): The paths to the files with PII.
+        outputPaths (list): The paths to the cleaned files to be saved, in the same order as filePaths.
+        verbose (bool, optional): Whether status updates should be printed to the console. Defaults to False.
+        piiNE (list, optional): The types of named entity PII to remove. Defaults to all types: ["PERSON", "ORGANIZATION", "GPE", "LOCATION"].
+        piiNums (list, optional): The types of ID info PII to remove. Defaults to all types: ["PHONE", "EMAIL", "SSN"].
+        processes (int, optional): The number of processes spaCy uses to find named entities. -1 uses all CPUs. Defaults to 1.
+
+    Raises:
+        ValueError: If there isn't exactly one output path for each file path.
+    """
+    if len(filePaths) != len(outputPaths):
+        raise ValueError(f"{len(filePaths)} files were given to clean but {len(outputPaths)} output paths were given. Each file needs one output path.")
+
+    texts = []
+    for filePath in filePaths:
+        if verbose: print("Extracting text from " + filePath + "...")
+        # gets the file's text
+        texts.append(extract(filePath))
+    if verbose: print("Text extracted.")
+
+    if verbose: print("Cleaning text: getting named entities and identifiable information...")
+    # finds the named entities in the windows of every file in batches, skipping spaCy entirely if no named entities are being removed
+    if piiNE:
+        docs = _getNLP().pipe((window for text in texts for offset, window in _windows(text)), batch_size=64, n_process=processes)
+    for text, outputPath in zip(texts, outputPaths):
+        # gets the ID info PII
+        pii = getIDInfo(text, piiNums)
+        # adds the named entity PII from each of this file's windows
+        if piiNE:
+            for (offset, window), doc in zip(_windows(text), docs):
+                pii.update(_shiftSpans(_docNE(doc, piiNE), offset))
+        if verbose: print(str(len(pii)) + " PII instances found.")
+
+        if verbose: print("Writing clean text to " + outputPath + ".")
+        # write the cleaned text to the output file
+        writeFile(_redact(text, ((start, end) for piiStr, start, end in pii)), outputPath)
+
+def cleanFilesParallel(pairs,
+        workers = None,
+        verbose = False,
+        piiNE = ["PERSON", "ORGANIZATION", "GPE", "LOCATION"], 
+        piiNums = ["PHONE", "EMAIL", "SSN"]):
+    """Cleans several files at the same time, each in its own worker process.
+
+    Args:
+        pairs (list): (filePath, outputPath) tuples of the files with PII and the paths their cleaned copies should be saved to.
+        workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        verbose (bool, optional): Whether status updates should be printed to the console. Defaults to False.
+        piiNE (list, optional): The types of named entity PII to remove. Defaults to all types: ["PERSON", "ORGANIZATION", "GPE", "LOCATION"].
+        piiNums (list, optional): The types of ID info PII to remove. Defaults to all types: ["PHONE", "EMAIL", "SSN"].
+    """
+    # each worker loads the spaCy pipeline the first time one of its files needs it and keeps it for the rest,
+    # so a pipeline that can't be loaded raises an error here instead of making the pool restart workers forever
+    with multiprocessing.Pool(processes=workers or os.cpu_count()) as pool:
+        pool.starmap(cleanFile, [(filePath, outputPath, verbose, piiNE, piiNums) for filePath, outputPath in pairs])
+
+def _readManifest(path):
+    """Reads the input and output paths of the files to clean from a manifest file.
+
+    Args:
+        path (str): The path to the manifest, which has one input path and output path per line, separated by a tab.
+
+    Raises:
+        ValueError: If a line doesn't hold exactly two paths.
+
+    Returns:
+        list: (filePath, outputPath) tuples.
+    """
+    pairs = []
+    with open(path) as file:
+        for lineNum, line in enumerate(file, 1):
+            # skips blank lines
+            if not line.strip():
+                continue
+            pair = line.rstrip("\n").split("\t")
+            if len(pair) != 2:
+                raise ValueError(f"Line {lineNum} of manifest {path} should be an input path and an output path separated by a tab.")
+            pairs.append((pair[0], pair[1]))
+    return pairs
+
+# if this file is being executed on the command line, parse arguments and process the user's files or text
 if __name__ == "__main__":
     parser = argparse.ArgumentParser("Removes personally identifiable information (PII) like names and phone numbers from text strings and files.")
 
-    parser.add_argument("-f", nargs=2, dest="path", default=[], metavar=("inputPath","outputPath"), help="the file to remove PII from and the clean output file path")
+    parser.add_argument("-f", nargs=2, dest="paths", action="append", default=[], metavar=("inputPath","outputPath"), help="the file to remove PII from and the clean output file path; can be repeated to clean several files")
+    parser.add_argument("-F", dest="manifest", default=None, metavar="manifestPath", help="a file listing an input path and output path per line, separated by a tab; the files are cleaned in parallel")
+    parser.add_argument("--workers", type=int, default=None, help="the number of worker processes used with -F; defaults to the number of CPUs")
     parser.add_argument("-s", dest="text", default=None, help="input a text string to clean")
 
     args = parser.parse_args()
 
-    # cleans the user's provided file
-    if len(args.path) == 2:
-        cleanFile(args.path[0], args.path[1], verbose=True)
+    # cleans the files listed in the user's manifest in parallel
+    if args.manifest is not None:
+        cleanFilesParallel(_readManifest(args.manifest), args.workers, verbose=True)
+    # cleans the user's provided files
+    elif args.paths:
+        cleanFiles([path[0] for path in args.paths], [path[1] for path in args.paths], verbose=True)
     # cleans the user's provided text
     elif args.text is not None:
         s = cleanString(args.text, verbose=True)
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import types
+import unittest
+
+import removepii
+
+class WindowTest(unittest.TestCase):
+    def setUp(self):
+        # small windows so window edges land inside the test strings
+        self.size, self.overlap = removepii._WINDOW_SIZE, removepii._WINDOW_OVERLAP
+        removepii._WINDOW_SIZE, removepii._WINDOW_OVERLAP = 8, 4
+
+    def tearDown(self):
+        removepii._WINDOW_SIZE, removepii._WINDOW_OVERLAP = self.size, self.overlap
+
+    def test_windows_cover_text(self):
+        text = "abcdefghijklmnopqrstuvwxyz"
+        windows = list(removepii._windows(text))
+        # every window starts where the text says it does and runs into the next one
+        for offset, window in windows:
+            self.assertEqual(window, text[offset:offset + 12])
+        self.assertEqual([offset for offset, window in windows], [0, 8, 16])
+        self.assertTrue(text.endswith(windows[-1][1]))
+
+    def test_id_info_not_found_at_window_edge(self):
+        # a window starts right after the 9, where the SSN regex would see a word boundary that isn't there
+        text = "1234567" + "9123-45-6789"
+        self.assertEqual(removepii.getIDInfo(text, ["SSN"]), set())
+        self.assertEqual(removepii.cleanString(text, piiNE=[], piiNums=["SSN"]), text)
+
+    def test_id_info_across_window_edge(self):
+        text = "call me: 800-123-4567 or a@b.com"
+        self.assertEqual(removepii.cleanString(text, piiNE=[]), "call me: XXXXX or XXXXX")
+
+    def test_long_text_windows_not_cached(self):
+        analyzed = []
+        def nlp(window):
+            # stands in for spaCy, finding no entities
+            analyzed.append(window)
+            return types.SimpleNamespace(ents=[])
+
+        original, removepii._NLP = removepii._NLP, nlp
+        removepii._cachedNE.cache_clear()
+        try:
+            removepii.cleanString("a much longer text than one window", piiNums=[])
+        finally:
+            removepii._NLP = original
+        self.assertEqual(len(analyzed), 4)
+        self.assertEqual(removepii._cachedNE.cache_info().currsize, 0)
+
+class IDInfoTest(unittest.TestCase):
+    def found(self, text, types):
+        return {piiStr for piiStr, start, end in removepii.getIDInfo(text, types)}
+
+    def test_phone_formats(self):
+        self.assertEqual(self.found("call 800-555-1234", ["PHONE"]), {"800-555-1234"})
+        self.assertEqual(self.found("call (800) 555.1234", ["PHONE"]), {"(800) 555.1234"})
+        self.assertEqual(self.found("call 555 1234", ["PHONE"]), {"555 1234"})
+
+    def test_phone_area_code_needs_separator(self):
+        self.assertEqual(self.found("call 800555-1234", ["PHONE"]), set())
+
+    def test_phone_not_after_word_character(self):
+        self.assertEqual(self.found("id x555-1234", ["PHONE"]), set())
+        self.assertEqual(self.found("id 1234-567-8901", ["PHONE"]), {"567-8901"})
+
+    def test_phone_extension(self):
+        self.assertEqual(self.found("800-555-1234 ext. 12", ["PHONE"]), {"800-555-1234 ext. 12"})
+        self.assertEqual(self.found("800-555-1234    ext 12", ["PHONE"]), {"800-555-1234    ext 12"})
+        self.assertEqual(self.found("555-1234x99", ["PHONE"]), {"555-1234x99"})
+        # an extension too short to be one isn't part of the number, and the number can't end mid-word
+        self.assertEqual(self.found("555-1234 x9", ["PHONE"]), {"555-1234"})
+        self.assertEqual(self.found("555-12345", ["PHONE"]), set())
+
+    def test_email_long_parts(self):
+        self.assertEqual(self.found("mail a@b.museum", ["EMAIL"]), {"a@b.museum"})
+        address = "x" * 70 + "@example.com"
+        self.assertEqual(self.found("mail " + address, ["EMAIL"]), {address})
+
+    def test_email_starts_at_username_run(self):
+        self.assertEqual(self.found("mail first.last+tag@mail.example.org.", ["EMAIL"]), {"first.last+tag@mail.example.org"})
+
+    def test_ssn(self):
+        self.assertEqual(self.found("SSN 123-45-0987", ["SSN"]), {"123-45-0987"})
+        self.assertEqual(self.found("SSN 666-45-0987 000-12-3456 123-00-4567 123-45-0000", ["SSN"]), set())
+        self.assertEqual(self.found("SSN 9123-45-6789", ["SSN"]), set())
+
+    def test_only_requested_types(self):
+        text = "800-555-1234 a@b.com 123-45-0987"
+        self.assertEqual(self.found(text, ["EMAIL"]), {"a@b.com"})
+        self.assertEqual(self.found(text, []), set())
+
+class RedactTest(unittest.TestCase):
+    def test_unordered_spans(self):
+        self.assertEqual(removepii._redact("abcdefghij", [(6, 8), (0, 2)]), "XXXXXcdefXXXXXij")
+
+    def test_overlapping_spans_merged(self):
+        self.assertEqual(removepii._redact("abcdefghij", [(2, 5), (0, 3), (4, 6)]), "XXXXXghij")
+
+    def test_touching_spans_kept_apart(self):
+        self.assertEqual(removepii._redact("abcdefghij", [(0, 2), (2, 4)]), "XXXXXXXXXXefghij")
+
+    def test_no_spans(self):
+        self.assertEqual(removepii._redact("abc", []), "abc")
+
+    def test_detected_name_inside_word_untouched(self):
+        text = "Al moved to Alabama."
+        def nlp(t):
+            # stands in for spaCy, finding only the standalone "Al"
+            return types.SimpleNamespace(ents=[types.SimpleNamespace(text="Al", label_="PERSON", start_char=0, end_char=2)])
+
+        original, removepii._NLP = removepii._NLP, nlp
+        removepii._cachedNE.cache_clear()
+        try:
+            cleaned = removepii.cleanString(text, piiNE=["PERSON"], piiNums=[])
+        finally:
+            removepii._NLP = original
+            removepii._cachedNE.cache_clear()
+        self.assertEqual(cleaned, "XXXXX moved to Alabama.")
+
+class PIIRedactorTest(unittest.TestCase):
+    text = "Jon at 800-555-1234 or jon@example.com, SSN 123-45-0987."
+
+    def test_matches_cleanString(self):
+        def nlp(t):
+            # stands in for spaCy, finding "Jon" as a person
+            return types.SimpleNamespace(ents=[types.SimpleNamespace(text="Jon", label_="PERSON", start_char=0, end_char=3)])
+
+        original, removepii._NLP = removepii._NLP, nlp
+        removepii._cachedNE.cache_clear()
+        try:
+            for piiNE, piiNums in [(["PERSON"], ["PHONE", "EMAIL", "SSN"]), (["PERSON"], ["EMAIL"]), ([], ["PHONE"])]:
+                redactor = removepii.PIIRedactor(piiNE, piiNums)
+                expected = set.union(removepii.getNE(self.text, piiNE), removepii.getIDInfo(self.text, piiNums))
+                self.assertEqual(redactor.find(self.text), expected)
+                self.assertEqual(redactor.clean(self.text), removepii.cleanString(self.text, piiNE=piiNE, piiNums=piiNums))
+        finally:
+            removepii._NLP = original
+            removepii._cachedNE.cache_clear()
+
+    def test_no_named_entities_skips_spacy(self):
+        def getNLP():
+            raise AssertionError("spaCy shouldn't be loaded")
+
+        original, removepii._getNLP = removepii._getNLP, getNLP
+        try:
+            redactor = removepii.PIIRedactor(piiNE=[])
+            self.assertEqual(redactor.clean(self.text), "Jon at XXXXX or XXXXX, SSN XXXXX.")
+            # long enough to be analyzed in windows
+            self.assertEqual(redactor.clean(self.text * 20000), "Jon at XXXXX or XXXXX, SSN XXXXX." * 20000)
+        finally:
+            removepii._getNLP = original
+
+class ExtractTest(unittest.TestCase):
+    def test_mapped_text_matches_read_text(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crlf.txt")
+            with open(path, "wb") as file:
+                file.write(b"John\r\nSmith\rlives here\n")
+
+            read = removepii.extract(path)
+            threshold = removepii._MMAP_THRESHOLD
+            # makes the small file take the memory-mapped path
+            removepii._MMAP_THRESHOLD = 0
+            try:
+                mapped = removepii.extract(path)
+            finally:
+                removepii._MMAP_THRESHOLD = threshold
+
+        self.assertEqual(read, "John\nSmith\nlives here\n")
+        self.assertEqual(mapped, read)
+
+class CleanFilesTest(unittest.TestCase):
+    def test_mismatched_paths(self):
+        with self.assertRaises(ValueError):
+            removepii.cleanFiles(["a.txt", "b.txt"], ["a_clean.txt"], piiNE=[])
+
+if __name__ == "__main__":
+    unittest.main()